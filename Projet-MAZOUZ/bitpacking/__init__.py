@@ -2,6 +2,7 @@ from .packing import (
     BitPacker,
     CrossBoundaryPacker,
     NoCrossPacker,
+    NoCrossPackerSIMD,
     OverflowBitPacker,
     PackerFactory,
     ZigZag,
@@ -11,6 +12,7 @@ __all__ = [
     "BitPacker",
     "CrossBoundaryPacker",
     "NoCrossPacker",
+    "NoCrossPackerSIMD",
     "OverflowBitPacker",
     "PackerFactory",
     "ZigZag",
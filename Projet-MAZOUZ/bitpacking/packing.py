@@ -1,8 +1,23 @@
 
 from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Protocol
+from typing import List, Optional, Tuple, Protocol, Union
 import math
+import sys
+from array import array
+from operator import lshift
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # NumPy-only or pure-Python fallback
+    njit = None
 
 WORD_BITS = 32
 WORD_MASK = (1 << WORD_BITS) - 1
@@ -15,6 +30,12 @@ def ceil_log2(x: int) -> int:
         return 0
     return (x-1).bit_length()
 
+def _alloc_words(num_words: int):
+    """Zeroed contiguous 32-bit word buffer: a uint32 ndarray, or array('I') without NumPy."""
+    if np is not None:
+        return np.zeros(num_words, dtype=np.uint32)
+    return array("I", bytes(4 * num_words))
+
 class ZigZag:
     """Signed<->Unsigned zigzag transform (like Protocol Buffers)."""
     @staticmethod
@@ -25,24 +46,314 @@ class ZigZag:
     def decode(u: int) -> int:
         return (u >> 1) ^ -(u & 1)
 
+    @staticmethod
+    def encode_array(a, bits: int = 64) -> "np.ndarray":
+        """Vectorized `encode` on `bits`-wide integers (32 or 64): (n << 1) ^ (n >> (bits-1))."""
+        signed_t, unsigned_t = (np.int32, np.uint32) if bits == 32 else (np.int64, np.uint64)
+        a = np.asarray(a).astype(signed_t)
+        return ((a << 1) ^ (a >> (bits - 1))).astype(unsigned_t)
+
+    @staticmethod
+    def decode_array(u, bits: int = 64) -> "np.ndarray":
+        """Vectorized `decode`, inverse of `encode_array` for the same `bits`."""
+        signed_t, unsigned_t = (np.int32, np.uint32) if bits == 32 else (np.int64, np.uint64)
+        u = np.asarray(u).astype(unsigned_t)
+        return (u >> 1).astype(signed_t) ^ -(u & 1).astype(signed_t)
+
+def _pack_cross_py(vals, k: int, num_words: int) -> "array":
+    """
+    Pack `vals` on k bits each, allowing values to straddle two words.
+    32 values fill exactly k words, so each such block is summed into one Python int
+    (disjoint shifted fields, so + is |) and serialized with int.to_bytes; the
+    shifting and OR-ing run in CPython's bigint code rather than in bytecode.
+    """
+    mask = (1 << k) - 1
+    shifts = [j * k for j in range(WORD_BITS)]
+    block_bytes = 4 * k
+    chunks = []
+    for start in range(0, len(vals), WORD_BITS):
+        block = sum(map(lshift, map(mask.__and__, vals[start:start + WORD_BITS]), shifts))
+        chunks.append(block.to_bytes(block_bytes, "little"))
+    words = array("I")
+    words.frombytes(b"".join(chunks)[:num_words * 4])
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+def _pack_cross_np(vals, k: int, num_words: int):
+    """Vectorized `_pack_cross_py`: scatter every value into uint64 words at once."""
+    n = len(vals)
+    v = np.asarray(vals, dtype=np.uint64) & np.uint64((1 << k) - 1)
+    bp = np.arange(n, dtype=np.uint64) * np.uint64(k)
+    wi = bp >> np.uint64(5)
+    off = bp & np.uint64(WORD_BITS - 1)
+    w = np.zeros(num_words + 1, dtype=np.uint64)
+    np.bitwise_or.at(w, wi, v << off)
+    # values straddling a word boundary carry their high bits into the next word
+    cross = off + np.uint64(k) > WORD_BITS
+    if cross.any():
+        np.bitwise_or.at(w, wi[cross] + np.uint64(1), v[cross] >> (np.uint64(WORD_BITS) - off[cross]))
+    return (w[:num_words] & np.uint64(WORD_MASK)).astype(np.uint32)
+
+def _pack_nocross_np(vals, k: int, num_words: int):
+    """Deposit `32 // k` values per word in one shift+OR over a (words, slots) view."""
+    slots_per_word = WORD_BITS // k
+    v = np.zeros(num_words * slots_per_word, dtype=np.uint64)
+    v[:len(vals)] = np.asarray(vals, dtype=np.uint64) & np.uint64((1 << k) - 1)
+    shifts = np.arange(slots_per_word, dtype=np.uint64) * np.uint64(k)
+    words = np.bitwise_or.reduce(v.reshape(num_words, slots_per_word) << shifts, axis=1)
+    return words.astype(np.uint32)
+
+def _unpack_nocross_np(words, k: int, n: int):
+    """Inverse of `_pack_nocross_np`: extract every slot of every word at once."""
+    slots_per_word = WORD_BITS // k
+    w = np.asarray(words, dtype=np.uint64)
+    shifts = np.arange(slots_per_word, dtype=np.uint64) * np.uint64(k)
+    u = (w[:, None] >> shifts) & np.uint64((1 << k) - 1)
+    return u.reshape(-1)[:n]
+
+if njit is not None:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _pack_cross(vals, k, out):
+        """JIT cross-boundary pack. Work is split by output word so writes stay disjoint."""
+        n = vals.shape[0]
+        mask = (np.int64(1) << k) - 1
+        for w in prange(out.shape[0]):
+            lo_bit = np.int64(w) * WORD_BITS
+            # every value whose bit range intersects [lo_bit, lo_bit + 32)
+            i0 = lo_bit // k
+            i1 = min(n, (lo_bit + WORD_BITS + k - 1) // k)
+            acc = np.int64(0)
+            for i in range(i0, i1):
+                v = np.int64(vals[i]) & mask
+                shift = i * k - lo_bit
+                if shift >= 0:
+                    acc |= v << shift
+                else:
+                    acc |= v >> -shift
+            out[w] = acc & WORD_MASK
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _unpack_cross(words, k, n, out):
+        """JIT inverse of `_pack_cross`: one independent read per output value."""
+        mask = (np.int64(1) << k) - 1
+        for i in prange(n):
+            bitpos = np.int64(i) * k
+            w_idx = bitpos >> 5
+            offset = bitpos & (WORD_BITS - 1)
+            x = np.int64(words[w_idx]) >> offset
+            if offset + k > WORD_BITS:
+                x |= np.int64(words[w_idx + 1]) << (WORD_BITS - offset)
+            out[i] = x & mask
+
+    @njit(cache=True)
+    def _bit_length_nb(x):
+        """int.bit_length for a non-negative int64, by halving steps."""
+        b = 0
+        for step in (32, 16, 8, 4, 2, 1):
+            if x >> step:
+                x >>= step
+                b += step
+        return b + (1 if x else 0)
+
+    @njit(cache=True)
+    def _choose_params_nb(u):
+        """JIT `OverflowBitPacker._choose_params`: one histogram pass, then O(1) scoring per k_small."""
+        n = u.shape[0]
+        cnt = np.zeros(65, np.int64)
+        max_bits = 0
+        for i in range(n):
+            b = _bit_length_nb(np.int64(u[i]))
+            cnt[b] += 1
+            if b > max_bits:
+                max_bits = b
+        k_max = max(1, max_bits)
+        above = np.zeros(k_max + 1, np.int64)
+        for k in range(max_bits - 1, -1, -1):
+            above[k] = above[k + 1] + cnt[k + 1]
+
+        best_total, best_b, best_over, best_m, best_k = -1, 0, 0, 0, 0
+        for k_small in range(1, k_max + 1):
+            m = above[k_small]
+            idx_bits = _bit_length_nb(m - 1) if m > 1 else 0
+            b_main = 1 + max(k_small, idx_bits)
+            k_over = max_bits if m > 0 else 0
+            total = n * b_main + m * k_over
+            # same ordering as the Python candidate tuple (total, -B_main, -k_over, -m)
+            if (best_total < 0 or total < best_total
+                    or (total == best_total and (b_main, k_over, m) > (best_b, best_over, best_m))):
+                best_total, best_b, best_over, best_m, best_k = total, b_main, k_over, m, k_small
+        return best_k, best_b, best_over, best_m
+
+def _prep_np(arr, signed: bool, use_zigzag: bool) -> Tuple["np.ndarray", int]:
+    """
+    NumPy value mapping shared by all packers: zigzag or two's complement in one
+    vectorized pass. Returns (uint32 codes, k), k being the minimal width.
+    """
+    if use_zigzag:
+        u = ZigZag.encode_array(arr).astype(np.uint32)
+    elif signed:
+        a = np.asarray(arr, dtype=np.int64)
+        if a.size == 0:
+            return a.astype(np.uint32), 0
+        max_abs = int(np.abs(a).max())
+        k = max(1, max_abs.bit_length() + 1)
+        u = np.where(a < 0, a + (1 << k), a).astype(np.uint32)
+        return u, k
+    else:
+        u = np.asarray(arr, dtype=np.uint32)
+    k = 0 if u.size == 0 else max(1, int(u.max()).bit_length())
+    return u, k
+
+def _restore_np(u, signed: bool, use_zigzag: bool, k: int):
+    """Inverse of `_prep_np` over an array of codes; k is the two's complement width."""
+    if use_zigzag:
+        return ZigZag.decode_array(u)
+    x = u.astype(np.int64)
+    if signed and k > 0:
+        return np.where(x & (1 << (k - 1)), x - (1 << k), x)
+    return x
+
+def _index_array(idxs, n: int):
+    """`idxs` as an int64 array, bounds-checked like `get`."""
+    idx = np.asarray(idxs, dtype=np.int64)
+    if idx.size and (idx.min() < 0 or idx.max() >= n):
+        raise IndexError("index out of range")
+    return idx
+
+_PLAN_CACHE: dict = {}
+
+def _cross_plan(k: int) -> tuple:
+    """
+    Per-slot tables for cross-boundary unpacking with width k. Offsets repeat every
+    P = 32 / gcd(k, 32) values, which span exactly W = k / gcd(k, 32) words, so only
+    P entries are stored: (P, W, word_rel, offset, lo_width, mask_lo, mask_hi).
+    """
+    plan = _PLAN_CACHE.get(k)
+    if plan is None:
+        g = math.gcd(k, WORD_BITS)
+        period, span = WORD_BITS // g, k // g
+        bitpos = np.arange(period, dtype=np.uint64) * np.uint64(k)
+        offset = bitpos & np.uint64(WORD_BITS - 1)
+        lo_width = np.minimum(np.uint64(k), np.uint64(WORD_BITS) - offset)
+        one = np.uint64(1)
+        mask_lo = (one << lo_width) - one
+        mask_hi = (one << (np.uint64(k) - lo_width)) - one
+        plan = _PLAN_CACHE[k] = (period, span, bitpos >> np.uint64(5), offset, lo_width, mask_lo, mask_hi)
+    return plan
+
+def _unpack_cross_np(words, n: int, plan: tuple):
+    """Vectorized cross-boundary unpack: the per-slot tables are broadcast over all periods."""
+    period, span, word_rel, offset, lo_width, mask_lo, mask_hi = plan
+    periods = ceil_div(n, period)
+    w = np.zeros(periods * span + 1, dtype=np.uint64)
+    w[:len(words)] = words
+    idx = (np.arange(periods, dtype=np.uint64) * np.uint64(span))[:, None] + word_rel
+    lo = (w[idx] >> offset) & mask_lo
+    hi = (w[idx + np.uint64(1)] & mask_hi) << lo_width
+    return (lo | hi).reshape(-1)[:n]
+
+_UNPACK_CACHE: dict = {}
+
+def _compile_unpack(k: int, cross: bool=True):
+    """
+    Build (and cache) a decoder specialized for width k: `fn(words, n) -> List[int]`.
+    Cross layout: one block of 32 values spans exactly k words, so the block is
+    unrolled into straight-line expressions whose shifts and masks are literals.
+    NoCross layout: one word holds 32 // k slots, unrolled the same way.
+    """
+    key = (k, cross)
+    fn = _UNPACK_CACHE.get(key)
+    if fn is not None:
+        return fn
+
+    mask = (1 << k) - 1
+    if cross:
+        span, per_block = k, WORD_BITS
+        exprs = []
+        for j in range(WORD_BITS):
+            bitpos = j * k
+            w_idx, offset = bitpos // WORD_BITS, bitpos % WORD_BITS
+            if offset + k <= WORD_BITS:
+                exprs.append(f"(w{w_idx} >> {offset}) & {mask}")
+            else:
+                exprs.append(f"((w{w_idx} >> {offset}) | (w{w_idx + 1} << {WORD_BITS - offset})) & {mask}")
+    else:
+        span, per_block = 1, WORD_BITS // k
+        exprs = [f"(w0 >> {slot * k}) & {mask}" for slot in range(per_block)]
+
+    names = ", ".join(f"w{j}" for j in range(span))
+    src = (
+        "def _unpack(words, n):\n"
+        f"    num_blocks = -(-n // {per_block})\n"
+        f"    words = list(words[:num_blocks * {span}])\n"
+        f"    words += [0] * (num_blocks * {span} - len(words))\n"
+        "    out = []\n"
+        f"    for b in range(0, num_blocks * {span}, {span}):\n"
+        f"        {names}, = words[b:b + {span}]\n"
+        f"        out += ({', '.join(exprs)},)\n"
+        "    del out[n:]\n"
+        "    return out\n"
+    )
+    ns: dict = {}
+    exec(compile(src, f"<unpack k={k} cross={cross}>", "exec"), ns)
+    fn = _UNPACK_CACHE[key] = ns["_unpack"]
+    return fn
+
 class BitPacker(Protocol):
     def compress(self, arr: List[int]) -> None: ...
     def decompress(self, out: List[int]) -> None: ...
+    def decompress_ndarray(self) -> "np.ndarray": ...
     def get(self, i: int) -> int: ...
+    def get_many(self, idxs: List[int]) -> List[int]: ...
     def compressed_words(self) -> List[int]: ...
     def bits_per_value(self) -> int: ...
     def size(self) -> int: ...
 
-@dataclass
-class _BaseState:
+class _BulkDecode(ABC):
+    """Shared bulk decompress: subclasses implement `_decompress_vec`."""
+    n: int
+
+    @abstractmethod
+    def _decompress_vec(self):
+        """All n decoded values: an int64 ndarray with NumPy, else a list."""
+
+    def decompress_ndarray(self):
+        """Decode all values at once into an int64 array (requires NumPy)."""
+        return np.asarray(self._decompress_vec(), dtype=np.int64)
+
+    def decompress(self, out: List[int]) -> None:
+        if len(out) < self.n:
+            raise ValueError("output buffer too small")
+        if self.n == 0:
+            return
+        values = self._decompress_vec()
+        if np is not None and isinstance(out, np.ndarray):
+            out[:self.n] = values
+            return
+        if np is not None:
+            values = values.tolist()
+        if isinstance(out, list):
+            out[:self.n] = values
+        else:
+            # other mutable sequences (e.g. array.array) may not accept a list slice
+            for i, v in enumerate(values):
+                out[i] = v
+
+@dataclass(eq=False)
+class _BaseState(_BulkDecode):
     k: int = 0
     n: int = 0
-    words: List[int] = None
+    words: Union["array", "np.ndarray"] = None  # uint32 ndarray, or array('I') without NumPy
     signed: bool = False
     use_zigzag: bool = False
+    _mask: int = 0  # (1 << k) - 1, cached by compress
+    _plan: Optional[tuple] = None  # per-slot unpack tables, cached by compress when used
 
     def _prep_values(self, arr: List[int]) -> Tuple[List[int], int]:
         """Return (unsigned_values, k) where k is minimal bits to represent max value."""
+        if np is not None:
+            return _prep_np(arr, self.signed, self.use_zigzag)
         if self.use_zigzag:
             u = [ZigZag.encode(x) for x in arr]
         elif self.signed:
@@ -58,7 +369,7 @@ class _BaseState:
             u = [(x + mod) & mask if x < 0 else x for x in arr]
             return u, k
         else:
-            u = arr[:]
+            u = arr
         k = 0 if not u else max(1, max(x for x in u).bit_length())
         return u, k
 
@@ -72,71 +383,103 @@ class _BaseState:
                 u = u - (1 << self.k)
         return u
 
+    def compressed_words(self) -> List[int]:
+        return self.words.tolist()
+
+    def __eq__(self, other):
+        # words is an ndarray/array('I'): compare its contents, not the buffer objects
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.k, self.n, self.signed, self.use_zigzag, self.compressed_words())
+                == (other.k, other.n, other.signed, other.use_zigzag, other.compressed_words()))
+
+    __hash__ = None
+
+    def _restore_array(self, u):
+        """Vectorized `_restore_value` over a NumPy array of unsigned codes."""
+        return _restore_np(u, self.signed, self.use_zigzag, self.k)
+
+    def _decompress_py(self, cross: bool) -> List[int]:
+        """Decode through the k-specialized unpacker from `_compile_unpack`."""
+        u = _compile_unpack(self.k, cross)(self.compressed_words(), self.n)
+        if self.signed or self.use_zigzag:
+            u = [self._restore_value(x) for x in u]
+        return u
+
 class CrossBoundaryPacker(_BaseState):
     """Bit packing that allows values to cross 32-bit word boundaries."""
     def __init__(self, signed: bool=False, use_zigzag: bool=False):
         super().__init__(signed=signed, use_zigzag=use_zigzag)
         self.k = 0
         self.n = 0
-        self.words = []
+        self.words = _alloc_words(0)
 
     def compress(self, arr: List[int]) -> None:
         vals, k_auto = self._prep_values(arr)
         self.k = k_auto if self.k == 0 else self.k
         k = max(1, self.k)
+        self._mask = (1 << k) - 1
+        # only the NumPy-without-Numba unpack reads the plan
+        self._plan = _cross_plan(k) if np is not None and njit is None else None
         self.n = len(vals)
         if self.n == 0:
-            self.words = []
+            self.words = _alloc_words(0)
             return
 
         bit_len = self.n * k
         num_words = ceil_div(bit_len, WORD_BITS)
-        words = [0] * num_words
-
-        bitpos = 0
-        for v in vals:
-            v &= (1 << k) - 1
-            w_idx = bitpos // WORD_BITS
-            offset = bitpos % WORD_BITS
-            if offset + k <= WORD_BITS:
-                words[w_idx] |= v << offset
-            else:
-                lo = WORD_BITS - offset
-                hi = k - lo
-                words[w_idx] |= (v & ((1 << lo) - 1)) << offset
-                words[w_idx + 1] |= v >> lo
-            bitpos += k
-
-        self.words = [w & WORD_MASK for w in words]
+        if njit is not None:
+            self.words = _alloc_words(num_words)
+            _pack_cross(np.asarray(vals, dtype=np.uint32), k, self.words)
+        elif np is not None:
+            self.words = _pack_cross_np(vals, k, num_words)
+        else:
+            self.words = _pack_cross_py(vals, k, num_words)
 
     def _get_unsigned(self, i: int) -> int:
         if i < 0 or i >= self.n:
             raise IndexError("index out of range")
-        k = self.k
-        bitpos = i * k
+        bitpos = i * self.k
         w_idx = bitpos // WORD_BITS
         offset = bitpos % WORD_BITS
-        if offset + k <= WORD_BITS:
-            chunk = (self.words[w_idx] >> offset) & ((1 << k) - 1)
-            return chunk
-        else:
-            lo = WORD_BITS - offset
-            hi = k - lo
-            low_part = (self.words[w_idx] >> offset) & ((1 << lo) - 1)
-            high_part = self.words[w_idx + 1] & ((1 << hi) - 1)
-            return (high_part << lo) | low_part
+        chunk = int(self.words[w_idx]) >> offset
+        if offset + self.k > WORD_BITS:
+            chunk |= int(self.words[w_idx + 1]) << (WORD_BITS - offset)
+        return chunk & self._mask
 
     def get(self, i: int) -> int:
         return self._restore_value(self._get_unsigned(i))
 
-    def decompress(self, out: List[int]) -> None:
-        if len(out) < self.n:
-            raise ValueError("output buffer too small")
-        for i in range(self.n):
-            out[i] = self.get(i)
-
-    def compressed_words(self) -> List[int]:
-        return self.words[:]
+    def get_many(self, idxs):
+        """Vectorized `get`: one gather of the low and high words for all indices."""
+        if np is None:
+            return [self.get(i) for i in idxs]
+        idx = _index_array(idxs, self.n)
+        if idx.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        idx = idx.astype(np.uint64)
+        k = np.uint64(self.k)
+        bitpos = idx * k
+        w_idx = bitpos >> np.uint64(5)
+        offset = bitpos & np.uint64(WORD_BITS - 1)
+        chunk = self.words[w_idx].astype(np.uint64) >> offset
+        cross = offset + k > WORD_BITS
+        hi_idx = np.minimum(w_idx + np.uint64(1), np.uint64(len(self.words) - 1))
+        hi = self.words[hi_idx].astype(np.uint64) << (np.uint64(WORD_BITS) - offset)
+        chunk |= np.where(cross, hi, np.uint64(0))
+        return self._restore_array(chunk & np.uint64(self._mask))
+
+    def _decompress_vec(self):
+        if np is None:
+            return self._decompress_py(cross=True) if self.n else []
+        if self.n == 0:
+            return np.zeros(0, dtype=np.int64)
+        if njit is not None:
+            u = np.empty(self.n, dtype=np.uint32)
+            _unpack_cross(self.words, self.k, self.n, u)
+        else:
+            u = _unpack_cross_np(self.words, self.n, self._plan)
+        return self._restore_array(u)
 
     def bits_per_value(self) -> int:
         return self.k
@@ -150,20 +493,26 @@ class NoCrossPacker(_BaseState):
         super().__init__(signed=signed, use_zigzag=use_zigzag)
         self.k = 0
         self.n = 0
-        self.words = []
+        self.words = _alloc_words(0)
+        self._slots_per_word = 0  # 32 // k, cached by compress
 
     def compress(self, arr: List[int]) -> None:
         vals, k_auto = self._prep_values(arr)
         self.k = k_auto if self.k == 0 else self.k
         k = max(1, self.k)
+        self._mask = (1 << k) - 1
+        self._slots_per_word = slots_per_word = WORD_BITS // k
         self.n = len(vals)
         if self.n == 0:
-            self.words = []
+            self.words = _alloc_words(0)
             return
 
-        slots_per_word = WORD_BITS // k
         num_words = ceil_div(self.n, slots_per_word)
-        words = [0] * num_words
+        if np is not None:
+            self.words = _pack_nocross_np(vals, k, num_words)
+            return
+
+        words = _alloc_words(num_words)
         for i, v in enumerate(vals):
             v &= (1 << k) - 1
             w_idx = i // slots_per_word
@@ -171,29 +520,43 @@ class NoCrossPacker(_BaseState):
             offset = slot * k
             words[w_idx] |= v << offset
 
-        self.words = [w & WORD_MASK for w in words]
+        self.words = words
 
     def _get_unsigned(self, i: int) -> int:
         if i < 0 or i >= self.n:
             raise IndexError("index out of range")
-        k = self.k
-        slots_per_word = WORD_BITS // k
-        w_idx = i // slots_per_word
-        slot = i % slots_per_word
-        offset = slot * k
-        return (self.words[w_idx] >> offset) & ((1 << k) - 1)
+        w_idx = i // self._slots_per_word
+        offset = (i % self._slots_per_word) * self.k
+        w = self.words[w_idx]
+        if np is not None:
+            w = int(w)  # ndarray items are NumPy scalars; array('I') already yields ints
+        return (w >> offset) & self._mask
 
     def get(self, i: int) -> int:
         return self._restore_value(self._get_unsigned(i))
 
-    def decompress(self, out: List[int]) -> None:
-        if len(out) < self.n:
-            raise ValueError("output buffer too small")
-        for i in range(self.n):
-            out[i] = self.get(i)
-
-    def compressed_words(self) -> List[int]:
-        return self.words[:]
+    def get_many(self, idxs):
+        """Vectorized `get` over an array of indices."""
+        if np is None:
+            return [self.get(i) for i in idxs]
+        idx = _index_array(idxs, self.n)
+        if idx.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        w_idx, offset = self._locate(idx)
+        u = self.words[w_idx] >> offset.astype(np.uint32)
+        return self._restore_array(u & np.uint32(self._mask))
+
+    def _locate(self, i):
+        """Return (word index, bit offset) of value i (an int or an index array)."""
+        w_idx, slot = divmod(i, self._slots_per_word)
+        return w_idx, slot * self.k
+
+    def _decompress_vec(self):
+        if np is None:
+            return self._decompress_py(cross=False) if self.n else []
+        if self.n == 0:
+            return np.zeros(0, dtype=np.int64)
+        return self._restore_array(_unpack_nocross_np(self.words, self.k, self.n))
 
     def bits_per_value(self) -> int:
         return self.k
@@ -201,7 +564,95 @@ class NoCrossPacker(_BaseState):
     def size(self) -> int:
         return self.n
 
-class OverflowBitPacker:
+class NoCrossPackerSIMD(NoCrossPacker):
+    """
+    NoCross packing with an interleaved (vertical) layout.
+    Values are taken in blocks of LANES*32: value j of a block goes to lane j % LANES,
+    and each lane fills its own column of words with 32 // k slots per word. Word row r
+    of a block is stored as LANES adjacent words, so a single shift/mask unpacks the
+    same slot of every lane at once. The tail block is zero-padded.
+    """
+    LANES = 4
+    PER_LANE = WORD_BITS
+
+    def _layout(self) -> Tuple[int, int]:
+        """Return (slots_per_word, rows) where rows is the number of word rows per block."""
+        slots_per_word = WORD_BITS // max(1, self.k)
+        return slots_per_word, ceil_div(self.PER_LANE, slots_per_word)
+
+    def _locate(self, i):
+        """Return (word index, bit offset) of value i (an int or an index array)."""
+        slots_per_word, rows = self._layout()
+        block, j = divmod(i, self.LANES * self.PER_LANE)
+        r, lane = divmod(j, self.LANES)
+        row, slot = divmod(r, slots_per_word)
+        return (block * rows + row) * self.LANES + lane, slot * self.k
+
+    def compress(self, arr: List[int]) -> None:
+        vals, k_auto = self._prep_values(arr)
+        self.k = k_auto if self.k == 0 else self.k
+        k = max(1, self.k)
+        self._mask = (1 << k) - 1
+        self._slots_per_word = WORD_BITS // k
+        self.n = len(vals)
+        if self.n == 0:
+            self.words = _alloc_words(0)
+            return
+
+        slots_per_word, rows = self._layout()
+        num_blocks = ceil_div(self.n, self.LANES * self.PER_LANE)
+        if np is not None:
+            v = np.zeros(num_blocks * self.LANES * self.PER_LANE, dtype=np.uint64)
+            v[:self.n] = np.asarray(vals, dtype=np.uint64) & np.uint64((1 << k) - 1)
+            # (block, value-in-lane, lane) -> pad each lane to rows*slots -> (block, row, slot, lane)
+            lanes = np.zeros((num_blocks, rows * slots_per_word, self.LANES), dtype=np.uint64)
+            lanes[:, :self.PER_LANE, :] = v.reshape(num_blocks, self.PER_LANE, self.LANES)
+            lanes = lanes.reshape(num_blocks, rows, slots_per_word, self.LANES)
+            shifts = (np.arange(slots_per_word, dtype=np.uint64) * np.uint64(k))[:, None]
+            words = np.bitwise_or.reduce(lanes << shifts, axis=2)
+            self.words = words.reshape(-1).astype(np.uint32)
+            return
+
+        words = _alloc_words(num_blocks * rows * self.LANES)
+        for i, v in enumerate(vals):
+            w_idx, offset = self._locate(i)
+            words[w_idx] |= (v & ((1 << k) - 1)) << offset
+        self.words = words
+
+    def _get_unsigned(self, i: int) -> int:
+        if i < 0 or i >= self.n:
+            raise IndexError("index out of range")
+        w_idx, offset = self._locate(i)
+        return (int(self.words[w_idx]) >> offset) & self._mask
+
+    def _decompress_vec(self):
+        if self.n == 0:
+            return [] if np is None else np.zeros(0, dtype=np.int64)
+        slots_per_word, rows = self._layout()
+        if np is None:
+            # each lane's words, in order, form a plain NoCross stream padded to rows*slots per block
+            per_block = rows * slots_per_word
+            unpack = _compile_unpack(self.k, cross=False)
+            words = self.compressed_words()
+            u = [0] * (len(words) // rows * self.PER_LANE)
+            for lane in range(self.LANES):
+                vals = unpack(words[lane::self.LANES], (len(words) // self.LANES) * slots_per_word)
+                if per_block != self.PER_LANE:
+                    vals = [v for b in range(0, len(vals), per_block) for v in vals[b:b + self.PER_LANE]]
+                u[lane::self.LANES] = vals
+            del u[self.n:]
+            if self.signed or self.use_zigzag:
+                u = [self._restore_value(x) for x in u]
+            return u
+        k = self.k
+        w = np.asarray(self.words, dtype=np.uint32).reshape(-1, rows, 1, self.LANES)
+        shifts = (np.arange(slots_per_word, dtype=np.uint32) * np.uint32(k))[:, None]
+        # each (row, slot) step decodes one value of every lane in a single vector op
+        lanes = (w >> shifts) & np.uint32((1 << k) - 1)
+        u = lanes.reshape(-1, rows * slots_per_word, self.LANES)[:, :self.PER_LANE, :]
+        return self._restore_array(u.reshape(-1)[:self.n])
+
+class OverflowBitPacker(_BulkDecode):
     """
     Bit packing with overflow area.
     - Choose k_small that minimizes total bits.
@@ -221,6 +672,7 @@ class OverflowBitPacker:
         self.k_over = 0
         self.n = 0
         self.m = 0  # number of overflow values
+        self.k_all = 0  # two's complement width used by _prep when signed
         self.index_map: List[int] = []  # maps overflow positions as we encode
 
     def _make_base(self) -> BitPacker:
@@ -232,32 +684,58 @@ class OverflowBitPacker:
             raise ValueError("base must be 'cross' or 'nocross'")
 
     def _prep(self, arr: List[int]) -> List[int]:
+        if np is not None:
+            # same zigzag / two's complement mapping as the base packers, as a uint32 array
+            u, k = _prep_np(arr, self.signed, self.use_zigzag)
+            if self.signed and not self.use_zigzag:
+                self.k_all = k
+            return u
         if self.use_zigzag:
             return [ZigZag.encode(x) for x in arr]
         if self.signed:
             if not arr: return []
             max_abs = max(abs(x) for x in arr)
-            k_all = max(1, max_abs.bit_length() + 1)
+            k_all = self.k_all = max(1, max_abs.bit_length() + 1)
             mod = 1 << k_all
             return [(x + mod) & (mod-1) if x < 0 else x for x in arr]
         return arr[:]
 
+    @staticmethod
+    def _bit_length_hist(u) -> List[int]:
+        """cnt[b] = number of values whose bit length is b; len(cnt) - 1 is the bit length of max(u)."""
+        if np is not None:
+            # frexp's exponent is exactly the bit length for integers below 2**53 (0 for 0)
+            bl = np.frexp(np.asarray(u, dtype=np.float64))[1]
+            return np.bincount(bl, minlength=1).tolist()
+        counts = Counter(x.bit_length() for x in u)
+        return [counts.get(b, 0) for b in range(max(counts) + 1)]
+
     def _choose_params(self, u: List[int]) -> None:
         n = len(u)
         if n == 0:
             self.k_small = self.B_main = self.k_over = self.m = self.n = 0
             return
-        max_u = max(u)
+        if njit is not None:
+            params = _choose_params_nb(np.asarray(u, dtype=np.uint32))
+            self.k_small, self.B_main, self.k_over, self.m = (int(p) for p in params)
+            self.n = n
+            return
+        cnt = self._bit_length_hist(u)
+        max_bits = len(cnt) - 1
+        k_max = max(1, max_bits)
+        # above[k] = number of values that need more than k bits (overflow count for k_small=k)
+        above = [0] * (k_max + 1)
+        for k in range(max_bits - 1, -1, -1):
+            above[k] = above[k + 1] + cnt[k + 1]
+
         best = None
         best_tuple = None
-
-        for k_small in range(1, max(1, max_u.bit_length()) + 1):
-            threshold = (1 << k_small) - 1
-            overflow_vals = [x for x in u if x > threshold]
-            m = len(overflow_vals)
+        for k_small in range(1, k_max + 1):
+            m = above[k_small]
             idx_bits = ceil_log2(m)
             B_main = 1 + max(k_small, idx_bits)
-            k_over = 0 if m == 0 else max(1, max(overflow_vals).bit_length())
+            # any overflow value implies the global max is among them
+            k_over = 0 if m == 0 else max_bits
             total_bits = n * B_main + m * k_over
             candidate = (total_bits, -B_main, -k_over, -m)
             if best is None or candidate < best:
@@ -279,18 +757,26 @@ class OverflowBitPacker:
 
         threshold = (1 << self.k_small) - 1
         idx_bits = self.B_main - 1
-        main_entries = []
-        overflow_vals = []
-        index_map = []
-        next_idx = 0
-        for x in u:
-            if x <= threshold:
-                main_entries.append((0 << idx_bits) | x)
-            else:
-                main_entries.append((1 << idx_bits) | next_idx)
-                overflow_vals.append(x)
-                index_map.append(next_idx)
-                next_idx += 1
+        if np is not None:
+            # mask-compress: outliers keep their order, their rank becomes the payload
+            is_over = u > threshold
+            idx = np.cumsum(is_over) - 1
+            main_entries = np.where(is_over, (1 << idx_bits) | idx, u).astype(np.uint32)
+            overflow_vals = u[is_over]
+            index_map = list(range(len(overflow_vals)))
+        else:
+            main_entries = []
+            overflow_vals = []
+            index_map = []
+            next_idx = 0
+            for x in u:
+                if x <= threshold:
+                    main_entries.append((0 << idx_bits) | x)
+                else:
+                    main_entries.append((1 << idx_bits) | next_idx)
+                    overflow_vals.append(x)
+                    index_map.append(next_idx)
+                    next_idx += 1
 
         self.main_packer = self._make_base()
         self.main_packer.k = self.B_main
@@ -314,22 +800,58 @@ class OverflowBitPacker:
         else:
             return self.overflow_packer.get(payload)
 
-    def get(self, i: int) -> int:
-        u = self._get_unsigned(i)
+    def _restore_value(self, u: int) -> int:
         if self.use_zigzag:
             return ZigZag.decode(u)
         if self.signed:
-            k = max(self.k_small + 1, self.k_over)
+            k = self.k_all
             sign_bit = 1 << (k - 1) if k > 0 else 0
             if sign_bit and (u & sign_bit):
                 u = u - (1 << k)
         return u
 
-    def decompress(self, out: List[int]) -> None:
-        if len(out) < self.n:
-            raise ValueError("output buffer too small")
-        for i in range(self.n):
-            out[i] = self.get(i)
+    def get(self, i: int) -> int:
+        return self._restore_value(self._get_unsigned(i))
+
+    def _restore_array(self, u):
+        """Vectorized signed/zigzag restore, same rules as `get`."""
+        return _restore_np(u, self.signed, self.use_zigzag, self.k_all)
+
+    def get_many(self, idxs):
+        """Vectorized `get`: gather main entries, then the flagged ones from the overflow area."""
+        if np is None:
+            return [self.get(i) for i in idxs]
+        idx = _index_array(idxs, self.n)
+        if idx.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        idx_bits = self.B_main - 1
+        entries = self.main_packer.get_many(idx)
+        is_over = (entries >> idx_bits) != 0
+        u = entries & ((1 << idx_bits) - 1)
+        if is_over.any():
+            u[is_over] = self.overflow_packer.get_many(u[is_over])
+        return self._restore_array(u)
+
+    def _decompress_vec(self):
+        """One decode pass over each area, outliers merged by index."""
+        if self.n == 0:
+            return [] if np is None else np.zeros(0, dtype=np.int64)
+        if np is None:
+            flag = 1 << (self.B_main - 1)
+            payload = flag - 1
+            over = self.overflow_packer._decompress_vec()
+            u = [over[e & payload] if e & flag else e for e in self.main_packer._decompress_vec()]
+            if self.signed or self.use_zigzag:
+                u = [self._restore_value(x) for x in u]
+            return u
+            return np.zeros(0, dtype=np.int64)
+        idx_bits = self.B_main - 1
+        main = self.main_packer.decompress_ndarray()
+        is_over = (main >> idx_bits) != 0
+        u = main & ((1 << idx_bits) - 1)
+        if is_over.any():
+            u[is_over] = self.overflow_packer.decompress_ndarray()[u[is_over]]
+        return self._restore_array(u)
 
     def bits_per_value(self) -> int:
         total_bits = self.n * self.B_main + self.m * self.k_over
@@ -348,6 +870,8 @@ class PackerFactory:
             return CrossBoundaryPacker(signed=signed, use_zigzag=zigzag)
         if kind == "nocross":
             return NoCrossPacker(signed=signed, use_zigzag=zigzag)
+        if kind == "nocross-simd":
+            return NoCrossPackerSIMD(signed=signed, use_zigzag=zigzag)
         if kind == "overflow-cross":
             return OverflowBitPacker(base="cross", signed=signed, use_zigzag=zigzag)
         if kind == "overflow-nocross":
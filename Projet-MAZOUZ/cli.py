@@ -1,41 +1,94 @@
 
 #!/usr/bin/env python3
-import argparse, json, random, time
+import argparse, json, operator, random, time
+from itertools import accumulate
+try:
+    import numpy as np
+except ImportError:
+    np = None
 from bitpacking import PackerFactory
 
-def measure(fn, *args, repeat=5, warmup=1):
+def measure(fn, *args, samples=7, warmup=1, min_sample_ns=1_000_000):
+    """
+    Best-of-`samples` time of one call, in ns. Each sample runs `fn` K times in a row,
+    K being doubled until a sample lasts at least `min_sample_ns`, so timer overhead
+    and clock resolution are amortized over K calls.
+    """
     for _ in range(warmup):
         fn(*args)
-    times = []
-    for _ in range(repeat):
+    iters = 1
+    while True:
         t0 = time.perf_counter_ns()
-        fn(*args)
-        t1 = time.perf_counter_ns()
-        times.append(t1 - t0)
-    return min(times)
+        for _ in range(iters):
+            fn(*args)
+        elapsed = time.perf_counter_ns() - t0
+        if elapsed >= min_sample_ns:
+            break
+        iters *= 2
+    times = [elapsed]
+    for _ in range(samples - 1):
+        t0 = time.perf_counter_ns()
+        for _ in range(iters):
+            fn(*args)
+        times.append(time.perf_counter_ns() - t0)
+    return min(times) / iters
+
+def delta_encode(arr):
+    """d[i] = a[i] - a[i-1] (with a[-1] = 0)."""
+    return list(map(operator.sub, arr, [0] + arr[:-1]))
+
+def delta_decode(d):
+    """Inverse of `delta_encode`: prefix sums."""
+    return list(accumulate(d))
 
-def run_once(kind: str, n: int, max_val: int, signed: bool=False, zigzag: bool=False, seed: int=0):
+def random_walk(rnd, n, lo, hi, step):
+    """n values in [lo, hi], each one at most `step` away from the previous one."""
+    x = rnd.randint(lo, hi)
+    out = []
+    for _ in range(n):
+        x = min(hi, max(lo, x + rnd.randint(-step, step)))
+        out.append(x)
+    return out
+
+def run_once(kind: str, n: int, max_val: int, signed: bool=False, zigzag: bool=False, seed: int=0,
+             delta: bool=False):
     rnd = random.Random(seed)
-    if signed:
-        arr = [rnd.randint(-max_val, max_val) for _ in range(n)]
+    lo = -max_val if signed else 0
+    if delta:
+        # delta coding only pays off on slowly varying series, uniform noise would make it worse
+        arr = random_walk(rnd, n, lo, max_val, step=max(1, max_val >> 8))
     else:
-        arr = [rnd.randint(0, max_val) for _ in range(n)]
+        arr = [rnd.randint(lo, max_val) for _ in range(n)]
+    if delta:
+        # deltas are signed even for unsigned input: zigzag keeps small |d| small
+        zigzag = True
     packer = PackerFactory.create(kind, signed=signed, zigzag=zigzag)
 
-    t_comp_ns = measure(packer.compress, arr, repeat=7, warmup=2)
+    if delta:
+        def compress(a):
+            packer.compress(delta_encode(a))
+        def decompress(o):
+            packer.decompress(o)
+            if np is not None:
+                np.cumsum(o, out=o)
+            else:
+                o[:] = delta_decode(o)
+    else:
+        compress, decompress = packer.compress, packer.decompress
+
+    t_comp_ns = measure(compress, arr, samples=7, warmup=2)
 
     idxs = [rnd.randrange(n) for _ in range(min(1000, max(1, n)))]
-    def do_gets():
-        s = 0
-        for i in idxs:
-            s ^= packer.get(i)
-        return s
-    t_get_ns = measure(do_gets, repeat=7, warmup=2)
+    if np is not None:
+        idxs = np.asarray(idxs, dtype=np.int64)
+    # with --delta the packer holds differences: a[i] is not reachable by direct access
+    t_get_ns = None if delta else measure(packer.get_many, idxs, samples=7, warmup=2)
 
-    out = [0]*n
-    t_decomp_ns = measure(packer.decompress, out, repeat=5, warmup=1)
+    # with NumPy, decode into an int64 buffer: the check below is then one vector compare
+    out = np.zeros(n, dtype=np.int64) if np is not None else [0]*n
+    t_decomp_ns = measure(decompress, out, samples=5, warmup=1)
 
-    ok = (out == arr)
+    ok = bool(np.array_equal(out, arr)) if np is not None else (out == arr)
     if kind.startswith("overflow"):
         total_bits = packer.n * packer.B_main + packer.m * packer.k_over
     else:
@@ -50,11 +103,13 @@ def run_once(kind: str, n: int, max_val: int, signed: bool=False, zigzag: bool=F
         "max_val": max_val,
         "signed": signed,
         "zigzag": zigzag,
+        "delta": delta,
         "kind": kind,
         "k": getattr(packer, "k", getattr(packer, "B_main", None)),
         "compressed_bytes": comp_bytes,
         "uncompressed_bytes": uncomp_bytes,
         "ratio": ratio,
+        "bits_per_int": total_bits / n if n else 0.0,
         "t_compress_ns": t_comp_ns,
         "t_get_ns": t_get_ns,
         "t_decompress_ns": t_decomp_ns,
@@ -84,17 +139,19 @@ def total_time_seconds(result, latency_s: float, bitrate_bits_per_s: float):
 
 def main():
     ap = argparse.ArgumentParser(description="Bit packing demo + benchmarks")
-    ap.add_argument("--kind", choices=["cross","nocross","overflow-cross","overflow-nocross"], default="cross")
+    ap.add_argument("--kind", choices=["cross","nocross","nocross-simd","overflow-cross","overflow-nocross"], default="cross")
     ap.add_argument("-n", type=int, default=1_000_000, help="array length")
     ap.add_argument("--max", dest="max_val", type=int, default=(1<<12)-1, help="max value magnitude")
     ap.add_argument("--signed", action="store_true")
     ap.add_argument("--zigzag", action="store_true")
+    ap.add_argument("--delta", action="store_true", help="pack a[i]-a[i-1] (zigzag-encoded) instead of a[i]")
     ap.add_argument("--seed", type=int, default=0)
     ap.add_argument("--latency", type=float, default=0.050, help="one-way link latency in seconds")
     ap.add_argument("--bitrate", type=float, default=10e6, help="link bitrate in bits/s")
     args = ap.parse_args()
 
-    res = run_once(args.kind, args.n, args.max_val, signed=args.signed, zigzag=args.zigzag, seed=args.seed)
+    res = run_once(args.kind, args.n, args.max_val, signed=args.signed, zigzag=args.zigzag, seed=args.seed,
+                   delta=args.delta)
     print(json.dumps(res, indent=2))
 
     R_be = break_even_bandwidth_bits_per_s(res)
@@ -1,6 +1,8 @@
 
 import random
-from bitpacking import PackerFactory
+from array import array
+import pytest
+from bitpacking import PackerFactory, ZigZag, packing
 
 def roundtrip(kind, arr, signed=False, zigzag=False):
     packer = PackerFactory.create(kind, signed=signed, zigzag=zigzag)
@@ -29,3 +31,141 @@ def test_signed_twos_complement():
     rng = random.Random(0)
     arr = [rng.randint(-5000,5000) for _ in range(10000)]
     roundtrip("nocross", arr, signed=True, zigzag=False)
+
+def test_cross_pack_numpy_matches_python():
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    for k in (1, 3, 7, 12, 17, 31, 32):
+        vals = [rng.randrange(1 << k) for _ in range(257)]
+        num_words = -(-len(vals) * k // 32)
+        assert packing._pack_cross_np(vals, k, num_words).tolist() == packing._pack_cross_py(vals, k, num_words).tolist()
+
+def test_cross_numba_kernels_roundtrip():
+    pytest.importorskip("numba")
+    import numpy as np
+    rng = random.Random(2)
+    for k in (1, 5, 12, 19, 32):
+        vals = [rng.randrange(1 << k) for _ in range(1001)]
+        num_words = -(-len(vals) * k // 32)
+        words = np.zeros(num_words, dtype=np.uint32)
+        packing._pack_cross(np.asarray(vals, dtype=np.uint32), k, words)
+        assert words.tolist() == packing._pack_cross_py(vals, k, num_words).tolist()
+        out = np.empty(len(vals), dtype=np.uint32)
+        packing._unpack_cross(words, k, len(vals), out)
+        assert out.tolist() == vals
+
+def test_nocross_numpy_kernels_roundtrip():
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    for k in (1, 2, 4, 7, 8, 11, 16, 32):
+        vals = [rng.randrange(1 << k) for _ in range(333)]
+        num_words = -(-len(vals) // (32 // k))
+        words = packing._pack_nocross_np(vals, k, num_words)
+        assert len(words) == num_words
+        assert packing._unpack_nocross_np(words, k, len(vals)).tolist() == vals
+
+def test_compiled_unpack_matches_get():
+    rng = random.Random(4)
+    for kind, cross in (("cross", True), ("nocross", False)):
+        for k in (1, 3, 8, 13, 31, 32):
+            arr = [rng.randrange(1 << k) for _ in range(100)]
+            packer = PackerFactory.create(kind)
+            packer.compress(arr)
+            unpack = packing._compile_unpack(packer.k, cross)
+            assert unpack is packing._compile_unpack(packer.k, cross)
+            assert unpack(packer.compressed_words(), len(arr)) == [packer.get(i) for i in range(len(arr))]
+
+def test_zigzag_array_widths():
+    np = pytest.importorskip("numpy")
+    vals = [0, -1, 1, -2, 2, 1024, -1025, 2**31 - 1, -2**31]
+    assert ZigZag.encode_array(vals, bits=32).tolist() == [ZigZag.encode(x) for x in vals]
+    assert ZigZag.decode_array(ZigZag.encode_array(vals, bits=32), bits=32).tolist() == vals
+    wide = vals + [2**40, -2**40, 2**62, -2**63]
+    codes = ZigZag.encode_array(wide)
+    assert codes.dtype == np.uint64
+    assert codes[:4].tolist() == [0, 1, 2, 3]
+    assert ZigZag.decode_array(codes).tolist() == wide
+
+def test_nocross_simd_roundtrip():
+    rng = random.Random(6)
+    for k in (1, 5, 7, 12, 32):
+        arr = [rng.randrange(1 << k) for _ in range(300)]
+        roundtrip("nocross-simd", arr)
+        packer = PackerFactory.create("nocross-simd")
+        packer.compress(arr)
+        assert [packer.get(i) for i in range(len(arr))] == arr
+    roundtrip("nocross-simd", [rng.randint(-500, 500) for _ in range(1000)], zigzag=True)
+
+def test_cross_plan_unpack_matches_get():
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    for k in (1, 6, 12, 20, 31, 32):
+        arr = [rng.randrange(1 << k) for _ in range(211)]
+        packer = PackerFactory.create("cross")
+        packer.compress(arr)
+        plan = packing._cross_plan(packer.k)
+        period, span = plan[:2]
+        assert period * k == span * 32
+        assert packing._unpack_cross_np(packer.words, len(arr), plan).tolist() == arr
+
+@pytest.mark.parametrize("kind", ["cross", "nocross", "nocross-simd", "overflow-cross", "overflow-nocross"])
+def test_get_many_matches_get(kind):
+    rng = random.Random(8)
+    arr = [rng.randint(-3000, 3000) if rng.random() < 0.9 else rng.randint(-2**20, 2**20) for _ in range(700)]
+    packer = PackerFactory.create(kind, zigzag=True)
+    packer.compress(arr)
+    idxs = [rng.randrange(len(arr)) for _ in range(300)] + [0, len(arr) - 1]
+    assert list(packer.get_many(idxs)) == [arr[i] for i in idxs]
+    with pytest.raises(IndexError):
+        packer.get_many([len(arr)])
+    assert list(packer.get_many([])) == []
+    empty = PackerFactory.create(kind, signed=True)
+    empty.compress([])
+    assert list(empty.get_many([])) == []
+
+def test_overflow_signed_twos_complement():
+    rng = random.Random(9)
+    arr = [rng.randint(-5000, 5000) for _ in range(2000)]
+    roundtrip("overflow-cross", arr, signed=True)
+    roundtrip("overflow-nocross", [rng.randint(-20, 20) for _ in range(500)] + [-70000, 90000], signed=True)
+
+def test_choose_params_numba_matches_histogram(monkeypatch):
+    pytest.importorskip("numba")
+    import numpy as np
+    kernel = packing._choose_params_nb
+    monkeypatch.setattr(packing, "njit", None)
+    rng = random.Random(10)
+    for _ in range(50):
+        u = [rng.randrange(1 << rng.randint(0, 32)) for _ in range(rng.randint(1, 300))]
+        packer = packing.OverflowBitPacker()
+        packer._choose_params(u)
+        assert kernel(np.asarray(u, dtype=np.uint32)) == (packer.k_small, packer.B_main, packer.k_over, packer.m)
+
+@pytest.mark.parametrize("kind", ["cross", "nocross", "nocross-simd", "overflow-cross", "overflow-nocross"])
+def test_decompress_into_ndarray_and_larger_list(kind):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(11)
+    arr = [rng.randint(-900, 900) for _ in range(500)] + [70000]
+    packer = PackerFactory.create(kind, zigzag=True)
+    packer.compress(arr)
+    out = np.zeros(len(arr), dtype=np.int64)
+    packer.decompress(out)
+    assert out.tolist() == arr
+    padded = [None] * (len(arr) + 3)
+    packer.decompress(padded)
+    assert padded[:len(arr)] == arr and padded[len(arr):] == [None] * 3
+    buf = array("q", bytes(8 * len(arr)))
+    packer.decompress(buf)
+    assert buf.tolist() == arr
+
+@pytest.mark.parametrize("kind", ["cross", "nocross", "nocross-simd"])
+def test_packer_equality(kind):
+    arr = [1, 2, 3, 4095, 4, 5, 255] * 40
+    a = PackerFactory.create(kind)
+    b = PackerFactory.create(kind)
+    assert a == b
+    a.compress(arr)
+    b.compress(arr)
+    assert a == b
+    b.compress(arr[:-1] + [6])
+    assert a != b